@@ -1,8 +1,547 @@
 import pandas as pd
+import numpy as np
+import xlsxwriter
 import os
+import sys
 import csv
+import io
+import mmap
 
-def process_ai_data(input_file_path, output_file_path, num_columns, ignore_extra_delimiters=False):
+# pyarrow is optional; the pandas path covers its absence.
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+# numba is optional; the line-by-line path covers its absence.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# polars is optional; the pyarrow and pandas paths cover its absence. Its
+# pandas hand-off needs pyarrow, so it is only used when both are present.
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+DELIMITER = '%'
+
+# Minimum row count before dictionary-encoding columns is worth the extra pass.
+CATEGORY_MIN_ROWS = 10_000
+
+# Rows per block handed to the streaming Excel writer.
+EXCEL_CHUNK_ROWS = 100_000
+
+# Files up to this size are decoded and split in one call; larger ones stream
+# line by line from a memory map.
+SPLITLINES_MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+# How many lines the line-by-line parsers process between progress reports.
+PROGRESS_LINE_INTERVAL = 50_000
+
+# Cap on per-line warnings collected while parsing.
+MAX_WARNINGS = 100
+
+
+class _WarningLog(list):
+    """
+    A warnings list that stops growing after MAX_WARNINGS entries.
+
+    A pathologically corrupt multi-million-line file would otherwise produce
+    one message per line, ballooning memory and freezing the report dialog.
+    Dropped messages are counted and summarized by flush(), which also lifts
+    the cap so the few closing messages after parsing always get through.
+    """
+    def __init__(self):
+        super().__init__()
+        self.suppressed = 0
+        self._capped = True
+
+    def append(self, message):
+        if not self._capped or len(self) < MAX_WARNINGS:
+            list.append(self, message)
+        else:
+            self.suppressed += 1
+
+    def flush(self):
+        if self.suppressed:
+            list.append(self, f"... and {self.suppressed} more warnings suppressed.")
+            self.suppressed = 0
+        self._capped = False
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _scan_rows(buf, delim, ncols):
+        """
+        Locates every cell boundary in one pass over the raw bytes.
+
+        Once ncols - 1 delimiters have been seen on a line, further
+        delimiters are folded into the last cell, mirroring the maxsplit
+        behaviour of the line-by-line parser. Returns per-row cell offsets,
+        field and delimiter counts, and the stripped line extents.
+        """
+        n = buf.size
+        # Count lines first so the output arrays can be allocated exactly.
+        n_lines = 0
+        for i in range(n):
+            if buf[i] == 10:
+                n_lines += 1
+        if n > 0 and buf[n - 1] != 10:
+            n_lines += 1
+
+        starts = np.zeros((n_lines, ncols), np.int64)
+        ends = np.zeros((n_lines, ncols), np.int64)
+        n_fields = np.zeros(n_lines, np.int64)
+        n_delims = np.zeros(n_lines, np.int64)
+        line_starts = np.zeros(n_lines, np.int64)
+        line_ends = np.zeros(n_lines, np.int64)
+
+        row = 0
+        pos = 0
+        while pos < n:
+            line_end = pos
+            while line_end < n and buf[line_end] != 10:
+                line_end += 1
+            # Trim surrounding whitespace the way str.strip() does.
+            start = pos
+            end = line_end
+            while start < end and (buf[start] == 32 or buf[start] == 9 or buf[start] == 13):
+                start += 1
+            while end > start and (buf[end - 1] == 32 or buf[end - 1] == 9 or buf[end - 1] == 13):
+                end -= 1
+            line_starts[row] = start
+            line_ends[row] = end
+
+            if end > start:
+                field = 0
+                field_start = start
+                for i in range(start, end):
+                    if buf[i] == delim:
+                        n_delims[row] += 1
+                        if field < ncols - 1:
+                            starts[row, field] = field_start
+                            ends[row, field] = i
+                            field += 1
+                            field_start = i + 1
+                starts[row, field] = field_start
+                ends[row, field] = end
+                n_fields[row] = field + 1
+
+            row += 1
+            pos = line_end + 1
+
+        return starts, ends, n_fields, n_delims, line_starts, line_ends
+
+
+def _drop_repeated_header_rows(df, warnings):
+    """
+    Drops rows that repeat the header, using one vectorized comparison
+    instead of checking each row in a Python loop.
+    """
+    repeated_header_mask = (df == df.columns.to_numpy()).all(axis=1)
+    repeated_count = int(repeated_header_mask.sum())
+    if repeated_count:
+        warnings.append(f"Warning: Skipped {repeated_count} repeated header row(s).")
+        df = df[~repeated_header_mask].reset_index(drop=True)
+    return df
+
+
+def _compress_repeated_values(df):
+    """
+    Converts low-cardinality columns to pandas' categorical dtype.
+
+    AI-generated text tends to repeat values in label-like columns; storing
+    every occurrence as its own string wastes memory, while a categorical
+    keeps one copy of each distinct value plus a small integer code per row.
+    Only worthwhile on large frames, so small ones are returned untouched.
+    """
+    if len(df) <= CATEGORY_MIN_ROWS:
+        return df
+    for col in df.columns:
+        series = df[col]
+        if series.nunique(dropna=False) / len(series) < 0.5:
+            df[col] = series.astype('category')
+    return df
+
+
+def _find_malformed_lines(data, num_columns, warnings):
+    """
+    Vectorized pre-scan of the raw file bytes.
+
+    Counts delimiters per line with numpy bincounts and returns two sorted
+    arrays of 0-based line indices: lines with the wrong number of fields
+    (reported like the line-by-line parser reports them) and blank or
+    whitespace-only lines (to be skipped silently). The header line is left
+    out; callers validate it separately. This pre-scan is the only way the
+    vectorized parsers can tell a short row from one whose trailing fields
+    are genuinely empty.
+    """
+    arr = np.frombuffer(data, dtype=np.uint8)
+    if arr.size == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+
+    newline = arr == 10  # \n
+    # Line index of each byte; a newline byte belongs to the line it ends.
+    line_ids = np.cumsum(newline) - newline
+    n_lines = int(line_ids[-1]) + 1
+
+    delims = np.bincount(line_ids[arr == ord(DELIMITER)], minlength=n_lines)
+    whitespace = newline | (arr == 32) | (arr == 9) | (arr == 13)
+    content = np.bincount(line_ids[~whitespace], minlength=n_lines)
+
+    blank = content == 0
+    bad = ~blank & (delims != num_columns - 1)
+    blank[0] = bad[0] = False  # header line is validated by the caller
+
+    bad_lines = np.flatnonzero(bad)
+    for idx in bad_lines:
+        warnings.append(f"Error on line {idx + 1}: Mismatch in column count. Expected {num_columns}, found {delims[idx] + 1}.")
+    return bad_lines, np.flatnonzero(blank)
+
+
+def _parse_with_polars(input_file_path, num_columns, warnings):
+    """
+    Parses the file with Polars' multi-threaded Rust CSV reader.
+
+    A pre-scan of the raw bytes locates rows with the wrong number of fields
+    (warned about and skipped, like every other path) and blank lines
+    (skipped silently); the scan then drops both by row index. The lazy scan
+    splits the file into blocks parsed in parallel and streams them through
+    collect, and the result is handed to pandas as arrow-backed columns
+    without copying the strings. Returns the DataFrame, or None if the file
+    is unusable.
+    """
+    with open(input_file_path, 'rb') as f:
+        data = f.read()
+
+    header_end = data.find(b'\n')
+    header_line = data if header_end == -1 else data[:header_end]
+    header_count = header_line.count(DELIMITER.encode('ascii')) + 1
+    if header_count != num_columns:
+        warnings.append(f"Error: Mismatch between expected columns ({num_columns}) and headers in file ({header_count}).")
+        return None
+
+    bad_lines, blank_lines = _find_malformed_lines(data, num_columns, warnings)
+    del data
+    # Data row r of the scan corresponds to file line r + 1; ragged lines are
+    # truncated by the reader only to be dropped here by index.
+    drop_rows = np.concatenate((bad_lines, blank_lines)) - 1
+
+    try:
+        lazy_frame = pl.scan_csv(
+            input_file_path,
+            separator=DELIMITER,
+            has_header=True,
+            infer_schema=False,
+            quote_char=None,
+            truncate_ragged_lines=True,
+        ).with_row_index('__row')
+        if len(drop_rows):
+            lazy_frame = lazy_frame.filter(~pl.col('__row').is_in(drop_rows.tolist()))
+        df = lazy_frame.drop('__row').collect(engine='streaming').to_pandas(use_pyarrow_extension_array=True)
+    except Exception as e:
+        warnings.append(f"Error reading input file: {e}")
+        return None
+
+    # Any nulls left are genuinely empty fields; store them as empty strings
+    # like the other paths do.
+    df = df.fillna('')
+
+    return _drop_repeated_header_rows(df, warnings)
+
+
+def _parse_with_arrow(input_file_path, num_columns, warnings):
+    """
+    Fastest path: parses the file with pyarrow's multi-threaded CSV reader.
+
+    Arrow scans for line boundaries with SIMD instructions and parses blocks
+    in parallel threads, then hands the columns to pandas without copying the
+    string data. Returns the DataFrame, or None if the file is unusable.
+    """
+    with open(input_file_path, 'r', encoding='utf-8') as f:
+        headers = f.readline().strip().split(DELIMITER)
+
+    if len(headers) != num_columns:
+        warnings.append(f"Error: Mismatch between expected columns ({num_columns}) and headers in file ({len(headers)}).")
+        return None
+
+    def handle_invalid_row(row):
+        # Whitespace-only lines arrive here as one-column rows; drop them
+        # quietly like the other paths, and only report real data rows.
+        if row.text.strip():
+            warnings.append(f"Warning: Skipping row with {row.actual_columns} columns (expected {num_columns}). Row: '{row.text}'")
+        return 'skip'
+
+    try:
+        table = pacsv.read_csv(
+            input_file_path,
+            read_options=pacsv.ReadOptions(column_names=headers, skip_rows=1, block_size=8 << 20),
+            parse_options=pacsv.ParseOptions(delimiter=DELIMITER, quote_char=False, invalid_row_handler=handle_invalid_row),
+            convert_options=pacsv.ConvertOptions(column_types={h: pa.string() for h in headers}),
+        )
+    except Exception as e:
+        warnings.append(f"Error reading input file: {e}")
+        return None
+
+    df = table.to_pandas(types_mapper=pd.ArrowDtype)
+    return _drop_repeated_header_rows(df, warnings)
+
+
+def _parse_with_pandas(input_file_path, num_columns, warnings):
+    """
+    Fast path: parses the whole file with pandas' C engine in one call.
+
+    The C parser tokenizes the file in native code and builds columnar arrays
+    directly, which is far faster than splitting each line in Python. The C
+    parser cannot tell a short row from one with empty trailing fields, so the
+    same byte pre-scan the polars path uses finds rows with the wrong field
+    count (warned about and skipped) and blank lines (skipped silently), and
+    both are excluded via skiprows. Returns the DataFrame, or None if the
+    file is unusable.
+    """
+    with open(input_file_path, 'rb') as f:
+        data = f.read()
+
+    header_end = data.find(b'\n')
+    header_line = data if header_end == -1 else data[:header_end]
+    header_count = header_line.count(DELIMITER.encode('ascii')) + 1
+    if header_count != num_columns:
+        warnings.append(f"Error: Mismatch between expected columns ({num_columns}) and headers in file ({header_count}).")
+        return None
+
+    bad_lines, blank_lines = _find_malformed_lines(data, num_columns, warnings)
+    skip = np.concatenate((bad_lines, blank_lines)).tolist()
+
+    try:
+        df = pd.read_csv(
+            io.BytesIO(data),
+            sep=DELIMITER,
+            dtype=str,
+            engine='c',
+            header=0,
+            index_col=False,
+            na_filter=False,
+            quoting=csv.QUOTE_NONE,
+            skiprows=skip,
+        )
+    except Exception as e:
+        warnings.append(f"Error reading input file: {e}")
+        return None
+
+    return _drop_repeated_header_rows(df, warnings)
+
+
+def _iter_mmap_lines(mm):
+    """
+    Yields decoded lines from a memory-mapped file.
+
+    The OS pages the file straight into the process's address space, so bytes
+    are only copied once, when a line is decoded into a Python string.
+    """
+    pos = 0
+    size = len(mm)
+    while pos < size:
+        newline = mm.find(b'\n', pos)
+        if newline == -1:
+            newline = size
+        yield mm[pos:newline].decode('utf-8')
+        pos = newline + 1
+
+
+def _parse_with_numba(input_file_path, num_columns, warnings, progress_cb=None):
+    """
+    ignore_extra_delimiters fast path: the Numba kernel finds every cell
+    boundary in a single compiled pass over the memory-mapped bytes, and only
+    the cells of valid rows are decoded into Python strings.
+    Returns the DataFrame, or None if no valid data was found.
+    """
+    if os.path.getsize(input_file_path) == 0:
+        return None
+
+    with open(input_file_path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        buf = np.frombuffer(mm, dtype=np.uint8)
+        starts, ends, n_fields, n_delims, line_starts, line_ends = \
+            _scan_rows(buf, ord(DELIMITER), num_columns)
+        # Release the view into the map so it can be closed afterwards.
+        del buf
+
+        # The scan is roughly the first half of the parse work.
+        if progress_cb is not None:
+            progress_cb(30)
+
+        header_bytes = mm[line_starts[0]:line_ends[0]]
+        header_count = int(n_delims[0]) + 1
+        if header_count != num_columns:
+            warnings.append(f"Error: Mismatch between expected columns ({num_columns}) and headers in file ({header_count}).")
+            return None
+        headers = [sys.intern(h) for h in header_bytes.decode('utf-8').split(DELIMITER)]
+
+        columns = [[] for _ in range(num_columns)]
+        for row in range(1, len(n_fields)):
+            if progress_cb is not None and row % PROGRESS_LINE_INTERVAL == 0:
+                progress_cb(30 + int(30 * row / len(n_fields)))
+            if n_fields[row] == 0:
+                continue
+            line_num = row + 1
+
+            if mm[line_starts[row]:line_ends[row]] == header_bytes:
+                warnings.append(f"Warning: Skipping repeated header row on line {line_num}.")
+                continue
+
+            if n_delims[row] > num_columns - 1:
+                warnings.append(f"Warning on line {line_num}: Extra delimiters found. Extra content was added to the last column.")
+
+            if n_fields[row] == num_columns:
+                for col in range(num_columns):
+                    columns[col].append(mm[starts[row, col]:ends[row, col]].decode('utf-8'))
+            else:
+                row_text = mm[line_starts[row]:line_ends[row]].decode('utf-8')
+                warnings.append(f"Error on line {line_num}: Mismatch in column count. Expected {num_columns}, found {n_fields[row]}. Row: '{row_text}'")
+
+    if not columns[0]:
+        return None
+
+    return pd.DataFrame(dict(zip(headers, columns)))
+
+
+def _parse_line_by_line(input_file_path, num_columns, warnings, progress_cb=None):
+    """
+    Line-by-line path used when extra delimiters must be folded into the last
+    column, which the vectorized parser cannot express.
+    Returns the DataFrame, or None if no valid data was found.
+    """
+    file_size = os.path.getsize(input_file_path)
+    if file_size == 0:
+        return None
+
+    if file_size < SPLITLINES_MAX_BYTES:
+        # One native splitlines call over the whole buffer replaces a
+        # per-line trip through the text-IO layer.
+        with open(input_file_path, 'r', encoding='utf-8') as f:
+            return _parse_decoded_lines(iter(f.read().splitlines()), num_columns, warnings,
+                                        progress_cb, file_size)
+
+    with open(input_file_path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return _parse_decoded_lines(_iter_mmap_lines(mm), num_columns, warnings,
+                                    progress_cb, file_size)
+
+
+def _parse_decoded_lines(lines, num_columns, warnings, progress_cb=None, total_bytes=0):
+    """
+    Consumes an iterator of decoded lines (header first) and builds the
+    DataFrame, or returns None if no valid data was found.
+    """
+    # Read the header line and process it. Interning the header strings
+    # caches their hashes, so the per-line header comparison and the final
+    # column-dict construction never rehash them.
+    header_line = next(lines, '').strip()
+    headers = [sys.intern(h) for h in header_line.split(DELIMITER)]
+
+    if len(headers) != num_columns:
+        warnings.append(f"Error: Mismatch between expected columns ({num_columns}) and headers in file ({len(headers)}).")
+        return None
+
+    # One list per column: appending values directly is much cheaper than
+    # building a throwaway dict per row for pandas to unpack again. A lighter
+    # per-row record (e.g. a namedtuple) would still cost an allocation per
+    # row, and nothing downstream needs row objects, so none are built.
+    columns = [[] for _ in range(num_columns)]
+
+    # Decoded characters stand in for bytes in the progress estimate; close
+    # enough for a progress bar.
+    chars_done = len(header_line)
+
+    def stripped_lines():
+        nonlocal chars_done
+        line_num = 1
+        for line in lines:
+            line_num += 1
+            chars_done += len(line) + 1
+            # Blank lines become empty rows without paying for a stripped copy.
+            if not line or line.isspace():
+                yield ''
+                continue
+            stripped = line.strip()
+            # One whole-string comparison catches a repeated header before
+            # the tokenizer does any per-field work on it.
+            if stripped == header_line:
+                warnings.append(f"Warning: Skipping repeated header row on line {line_num}.")
+                yield ''
+                continue
+            yield stripped
+
+    # Read and process the rest of the data lines. csv.reader tokenizes in C
+    # instead of one Python-level split per line; quoting is disabled so
+    # fields come out exactly as str.split produced them.
+    reader = csv.reader(stripped_lines(), delimiter=DELIMITER, quoting=csv.QUOTE_NONE)
+    try:
+        for line_num, parts in enumerate(reader, start=2): # Start counting from line 2
+            if not parts:
+                continue
+            if progress_cb is not None and total_bytes and line_num % PROGRESS_LINE_INTERVAL == 0:
+                progress_cb(min(60, int(60 * chars_done / total_bytes)))
+
+            # Fold any extra fields back into the last column, matching the
+            # maxsplit behaviour the reader cannot express itself.
+            if len(parts) > num_columns:
+                parts[num_columns - 1:] = [DELIMITER.join(parts[num_columns - 1:])]
+                warnings.append(f"Warning on line {line_num}: Extra delimiters found. Extra content was added to the last column.")
+
+            if len(parts) == num_columns:
+                for col, value in enumerate(parts):
+                    columns[col].append(value)
+            else:
+                warnings.append(f"Error on line {line_num}: Mismatch in column count. Expected {num_columns}, found {len(parts)}. Row: '{DELIMITER.join(parts)}'")
+    except csv.Error as e:
+        warnings.append(f"Error while tokenizing the file: {e}")
+        return None
+
+    if not columns[0]:
+        return None
+
+    return pd.DataFrame(dict(zip(headers, columns)))
+
+
+def _write_excel_streaming(df, output_file_path, progress_cb=None):
+    """
+    Writes the DataFrame to xlsx one row at a time with xlsxwriter's
+    constant_memory mode, so the workbook is never built as an in-memory tree
+    of cell objects. constant_memory discards any cell written above the
+    current row, which rules out to_excel here: it emits column blocks, and
+    going back up a column would silently drop cells.
+
+    Rows are pulled from the frame in fixed-size blocks: each block is
+    materialized as a plain object array, streamed out, then released, so the
+    writer's extra memory stays bounded by the block size however large the
+    input grows.
+    """
+    workbook = xlsxwriter.Workbook(
+        output_file_path,
+        {'constant_memory': True, 'strings_to_numbers': False},
+    )
+    try:
+        worksheet = workbook.add_worksheet('Sheet1')
+        worksheet.write_row(0, 0, [str(col) for col in df.columns])
+        row_num = 1
+        for start in range(0, len(df), EXCEL_CHUNK_ROWS):
+            block = df.iloc[start:start + EXCEL_CHUNK_ROWS].to_numpy(dtype=object)
+            for row in block:
+                worksheet.write_row(row_num, 0, row)
+                row_num += 1
+            if progress_cb is not None:
+                # The write phase covers the last 30% of the overall run.
+                progress_cb(70 + int(30 * (row_num - 1) / len(df)))
+    finally:
+        workbook.close()
+
+
+def process_ai_data(input_file_path, output_file_path, num_columns, ignore_extra_delimiters=False, progress_cb=None):
     """
     Processes raw text data from a file, standardizes it, and saves it to an Excel file.
     It now handles duplicate headers and extra delimiters gracefully.
@@ -12,73 +551,90 @@ def process_ai_data(input_file_path, output_file_path, num_columns, ignore_extra
         output_file_path (str): The path for the output Excel file.
         num_columns (int): The number of columns to expect in the data.
         ignore_extra_delimiters (bool): Flag to ignore extra delimiters and put content in the last column.
-    
+        progress_cb (callable): Optional; called with a 0-100 percentage as processing advances.
+
     Returns:
         tuple[pd.DataFrame, list]: A tuple containing the DataFrame and a list of warnings, or (None, None) on failure.
     """
-    DELIMITER = '%'
-    warnings = []
-    processed_data = []
-    
+    warnings = _WarningLog()
+
+    def report(percent):
+        if progress_cb is not None:
+            progress_cb(percent)
+
     # 1. Check if the input file exists
     if not os.path.exists(input_file_path):
         warnings.append(f"Error: Input file '{input_file_path}' not found.")
         return None, warnings
 
-    with open(input_file_path, 'r', encoding='utf-8') as f:
-        # 2. Read the header line and process it
-        header_line = f.readline().strip()
-        headers = header_line.split(DELIMITER)
-        
-        if len(headers) != num_columns:
-            warnings.append(f"Error: Mismatch between expected columns ({num_columns}) and headers in file ({len(headers)}).")
-            return None, warnings
-            
-        # 3. Read and process the rest of the data lines
-        for line_num, line in enumerate(f, start=2): # Start counting from line 2
-            stripped_line = line.strip()
-            if not stripped_line:
-                continue
+    # 2. Fast-fail on a misconfigured column count: peek at the first data
+    # line so an unusable file is rejected after one line instead of after a
+    # full parse. Only applies when extra delimiters are not being folded.
+    if not ignore_extra_delimiters:
+        with open(input_file_path, 'r', encoding='utf-8') as f:
+            f.readline()  # header; each parser validates it separately
+            first_data_line = f.readline()
+            while first_data_line and not first_data_line.strip():
+                first_data_line = f.readline()
+        first_data_line = first_data_line.strip()
+        if first_data_line:
+            found = first_data_line.count(DELIMITER) + 1
+            if found != num_columns:
+                warnings.append(f"Error: The first data line has {found} columns but {num_columns} were expected. Check the column count, or enable 'Ignore extra delimiters'.")
+                return None, warnings
 
-            # --- New logic for handling duplicate headers ---
-            parts_for_check = stripped_line.split(DELIMITER)
-            if parts_for_check == headers:
-                warnings.append(f"Warning: Skipping repeated header row on line {line_num}.")
-                continue
+    # 3. Parse the file. The maxsplit behaviour for extra delimiters needs the
+    # line-by-line path; everything else goes through the fastest vectorized
+    # parser available.
+    report(0)
+    if ignore_extra_delimiters:
+        if numba is not None:
+            df = _parse_with_numba(input_file_path, num_columns, warnings, progress_cb)
+        else:
+            df = _parse_line_by_line(input_file_path, num_columns, warnings, progress_cb)
+    elif pl is not None and pa is not None:
+        df = _parse_with_polars(input_file_path, num_columns, warnings)
+    elif pa is not None:
+        df = _parse_with_arrow(input_file_path, num_columns, warnings)
+    else:
+        df = _parse_with_pandas(input_file_path, num_columns, warnings)
 
-            # --- New logic for handling extra delimiters based on user flag ---
-            if ignore_extra_delimiters:
-                # Use maxsplit to put all extra content into the last column
-                parts = stripped_line.split(DELIMITER, maxsplit=num_columns - 1)
-                
-                # Check if there were extra delimiters and warn the user
-                if stripped_line.count(DELIMITER) > num_columns - 1:
-                    warnings.append(f"Warning on line {line_num}: Extra delimiters found. Extra content was added to the last column.")
-            else:
-                # Standard split without maxsplit
-                parts = stripped_line.split(DELIMITER)
-            
-            if len(parts) == num_columns:
-                try:
-                    row_dict = dict(zip(headers, parts))
-                    processed_data.append(row_dict)
-                except Exception as e:
-                    warnings.append(f"Error creating dictionary for line {line_num}: {e}")
-            else:
-                warnings.append(f"Error on line {line_num}: Mismatch in column count. Expected {num_columns}, found {len(parts)}. Row: '{stripped_line}'")
-    
-    if not processed_data:
+    # Parsing is the only step that can overflow the warning cap; summarize
+    # anything it dropped before the closing messages are added.
+    warnings.flush()
+
+    if df is None or df.empty:
         warnings.append("No valid data found to process.")
         return None, warnings
 
-    # 4. Create a DataFrame and save to Excel
+    # Parsing accounts for the first 60% of the reported progress, the
+    # dictionary-encoding pass for the next 10%, and the write for the rest.
+    report(60)
+
+    # Dictionary-encode columns full of repeated values to cut memory before
+    # the (potentially expensive) write step.
+    df = _compress_repeated_values(df)
+    report(70)
+
+    # 4. Save the DataFrame in the format implied by the output extension.
+    # CSV and Parquet skip the XML/ZIP work that makes xlsx slow, so they are
+    # offered as fast-path outputs for large datasets.
+    ext = os.path.splitext(output_file_path)[1].lower()
     try:
-        df = pd.DataFrame(processed_data)
-        df.to_excel(output_file_path, index=False, engine='openpyxl')
+        if ext == '.csv':
+            df.to_csv(output_file_path, index=False)
+        elif ext == '.parquet':
+            df.to_parquet(output_file_path, engine='pyarrow', compression='zstd')
+        else:
+            _write_excel_streaming(df, output_file_path, progress_cb)
+        report(100)
         warnings.append(f"Data successfully saved to '{output_file_path}'.")
         return df, warnings
+    except ImportError:
+        warnings.append("Error: Saving to Parquet requires the 'pyarrow' library (pip install pyarrow).")
+        return None, warnings
     except Exception as e:
-        warnings.append(f"Error saving to Excel file: {e}")
+        warnings.append(f"Error saving to '{output_file_path}': {e}")
         return None, warnings
 
 # --- How to use this script (This part will be updated by the GUI) ---
@@ -88,11 +644,11 @@ if __name__ == "__main__":
     OUTPUT_FILENAME = '../data/output_data.xlsx'
     COLUMNS = 4
     IGNORE_EXTRA_DELIMITERS = True # Example flag
-    
+
     # The function now returns a tuple of (DataFrame, warnings)
     df, all_warnings = process_ai_data(INPUT_FILENAME, OUTPUT_FILENAME, COLUMNS, IGNORE_EXTRA_DELIMITERS)
-    
+
     if all_warnings:
         print("\n--- Processing Report ---")
         for w in all_warnings:
-            print(w)
\ No newline at end of file
+            print(w)
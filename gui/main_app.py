@@ -1,10 +1,11 @@
 import sys
 import os
+import types
 from PySide6.QtWidgets import (
     QApplication, QWidget, QGridLayout, QLabel, QLineEdit, QPushButton, 
-    QMessageBox, QFileDialog, QComboBox, QCheckBox
+    QMessageBox, QFileDialog, QComboBox, QCheckBox, QProgressBar
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject, QThread, Signal
 
 # Import the data processing function from the data_processor module.
 # Assumes data_processor.py is in the 'core' folder.
@@ -14,16 +15,70 @@ from data_processor import process_ai_data
 # Import translations
 from translations import TRANSLATIONS, LANGUAGES
 
+# Attribute name -> translation key for every string update_language refreshes.
+UI_STRINGS = {
+    "window_title": "Research Data Processor",
+    "input_label": "Input File Path:",
+    "input_placeholder": "e.g. data/input_data.txt",
+    "output_label": "Output File Path:",
+    "output_placeholder": "e.g. data/output_data.xlsx",
+    "columns_label": "Number of Columns:",
+    "columns_placeholder": "e.g. 8",
+    "ignore_checkbox": "Ignore extra delimiters",
+    "browse": "Browse",
+    "process_button": "Process Data",
+    "author": "Developed by Ahmadreza Haj Talebi",
+}
+
+class ProcessingWorker(QObject):
+    """Runs process_ai_data on a worker thread and reports the result."""
+    finished = Signal(object, list)
+    progress = Signal(int)
+
+    def __init__(self, input_path, output_path, num_columns, ignore_extra_delimiters):
+        super().__init__()
+        self.input_path = input_path
+        self.output_path = output_path
+        self.num_columns = num_columns
+        self.ignore_extra_delimiters = ignore_extra_delimiters
+
+    def run(self):
+        # An uncaught exception here would leave finished unemitted, the
+        # thread running, and the process button disabled for good.
+        try:
+            df, warnings = process_ai_data(
+                self.input_path, self.output_path, self.num_columns,
+                ignore_extra_delimiters=self.ignore_extra_delimiters,
+                progress_cb=self.progress.emit
+            )
+        except Exception as e:
+            df, warnings = None, [f"Error while processing the file: {e}"]
+        self.finished.emit(df, warnings or [])
+
+
 class MainWindow(QWidget):
     def __init__(self):
         super().__init__()
         self.current_lang = "en" # Default language is English
+        self._rebuild_translation_table()
         self.setup_ui()
         self.update_language() # Set initial language and text
 
     def tr(self, key):
         """Translates a given key to the current language."""
-        return TRANSLATIONS.get(key, {}).get(self.current_lang, key)
+        return self._tr_table.get(key, key)
+
+    def _rebuild_translation_table(self):
+        """
+        Snapshots the active language's strings into one flat dict, so each
+        tr() call is a single lookup instead of two nested ones. The widget
+        strings are also snapshotted as attributes in one pass, so
+        update_language reads them without any lookups at all.
+        """
+        self._tr_table = {key: langs.get(self.current_lang, key) for key, langs in TRANSLATIONS.items()}
+        self._strings = types.SimpleNamespace(
+            **{attr: self._tr_table.get(key, key) for attr, key in UI_STRINGS.items()}
+        )
 
     def setup_ui(self):
         main_layout = QGridLayout()
@@ -61,7 +116,12 @@ class MainWindow(QWidget):
         self.process_button = QPushButton(self.tr("Process Data"))
         self.process_button.clicked.connect(self.process_data_from_gui)
 
-        # 7. Author Info
+        # 7. Progress Bar
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(0)
+
+        # 8. Author Info
         self.author_label = QLabel(self.tr("Developed by Ahmadreza Haj Talebi"))
         self.author_label.setStyleSheet("color: gray; font-size: 10px;")
 
@@ -82,7 +142,8 @@ class MainWindow(QWidget):
 
         main_layout.addWidget(self.ignore_checkbox, 4, 0, 1, 3) # Span across all 3 columns
         main_layout.addWidget(self.process_button, 5, 0, 1, 3) # Span across all 3 columns
-        main_layout.addWidget(self.author_label, 6, 0, 1, 3, alignment=Qt.AlignCenter)
+        main_layout.addWidget(self.progress_bar, 6, 0, 1, 3) # Span across all 3 columns
+        main_layout.addWidget(self.author_label, 7, 0, 1, 3, alignment=Qt.AlignCenter)
 
         self.setLayout(main_layout)
         self.setWindowTitle(self.tr("Research Data Processor"))
@@ -92,22 +153,25 @@ class MainWindow(QWidget):
         """Updates all UI text based on the selected language."""
         selected_language = self.language_combo.currentText()
         self.current_lang = LANGUAGES.get(selected_language, "en")
-        
+        self._rebuild_translation_table()
+
+        strings = self._strings
+
         # Update window title
-        self.setWindowTitle(self.tr("Research Data Processor"))
-        
+        self.setWindowTitle(strings.window_title)
+
         # Update labels
-        self.input_label.setText(self.tr("Input File Path:"))
-        self.input_entry.setPlaceholderText(self.tr("e.g. data/input_data.txt"))
-        self.output_label.setText(self.tr("Output File Path:"))
-        self.output_entry.setPlaceholderText(self.tr("e.g. data/output_data.xlsx"))
-        self.columns_label.setText(self.tr("Number of Columns:"))
-        self.columns_entry.setPlaceholderText(self.tr("e.g. 8"))
-        self.ignore_checkbox.setText(self.tr("Ignore extra delimiters"))
-        self.input_browse_button.setText(self.tr("Browse"))
-        self.output_browse_button.setText(self.tr("Browse"))
-        self.process_button.setText(self.tr("Process Data"))
-        self.author_label.setText(self.tr("Developed by Ahmadreza Haj Talebi"))
+        self.input_label.setText(strings.input_label)
+        self.input_entry.setPlaceholderText(strings.input_placeholder)
+        self.output_label.setText(strings.output_label)
+        self.output_entry.setPlaceholderText(strings.output_placeholder)
+        self.columns_label.setText(strings.columns_label)
+        self.columns_entry.setPlaceholderText(strings.columns_placeholder)
+        self.ignore_checkbox.setText(strings.ignore_checkbox)
+        self.input_browse_button.setText(strings.browse)
+        self.output_browse_button.setText(strings.browse)
+        self.process_button.setText(strings.process_button)
+        self.author_label.setText(strings.author)
     
     def browse_file(self, line_edit_widget, is_input):
         """Opens a file dialog for selecting input or output files."""
@@ -117,7 +181,7 @@ class MainWindow(QWidget):
             file_path, _ = QFileDialog.getOpenFileName(self, dialog_title, "", file_filters)
         else:
             dialog_title = self.tr("Select Output Path")
-            file_filters = self.tr("Excel Files (*.xlsx)")
+            file_filters = self.tr("Excel Files (*.xlsx);;CSV Files (*.csv);;Parquet Files (*.parquet)")
             file_path, _ = QFileDialog.getSaveFileName(self, dialog_title, "", file_filters)
         
         if file_path:
@@ -143,9 +207,25 @@ class MainWindow(QWidget):
             QMessageBox.warning(self, self.tr("Input Error"), self.tr("Number of columns must be a valid integer."))
             return
 
-        # Call the data processing function with the new flag
-        df, warnings = process_ai_data(input_path, output_path, num_columns, ignore_extra_delimiters=ignore_flag)
-        
+        # Run the processing on a worker thread so the window keeps repainting
+        # and responding to input while large files are parsed and written.
+        self.process_button.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self.thread = QThread()
+        self.worker = ProcessingWorker(input_path, output_path, num_columns, ignore_flag)
+        self.worker.moveToThread(self.thread)
+        self.thread.started.connect(self.worker.run)
+        self.worker.progress.connect(self.progress_bar.setValue)
+        self.worker.finished.connect(self.on_processing_finished)
+        self.worker.finished.connect(self.thread.quit)
+        self.thread.finished.connect(self.worker.deleteLater)
+        self.thread.finished.connect(self.thread.deleteLater)
+        self.thread.start()
+
+    def on_processing_finished(self, df, warnings):
+        """Shows the processing report once the worker thread is done."""
+        self.process_button.setEnabled(True)
+
         if warnings:
             QMessageBox.information(self, self.tr("Processing Report"), "\n".join(warnings))
 
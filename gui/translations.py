@@ -239,14 +239,14 @@ TRANSLATIONS = {
         "ko": "출력 경로 선택",
         "de": "Ausgabepfad auswählen",
     },
-    "Excel Files (*.xlsx)": {
-        "en": "Excel Files (*.xlsx)",
-        "fa": "فایل‌های اکسل (*.xlsx)",
-        "zh": "Excel 文件 (*.xlsx)",
-        "ru": "Файлы Excel (*.xlsx)",
-        "ja": "Excelファイル (*.xlsx)",
-        "ar": "ملفات Excel (*.xlsx)",
-        "ko": "Excel 파일 (*.xlsx)",
-        "de": "Excel-Dateien (*.xlsx)",
+    "Excel Files (*.xlsx);;CSV Files (*.csv);;Parquet Files (*.parquet)": {
+        "en": "Excel Files (*.xlsx);;CSV Files (*.csv);;Parquet Files (*.parquet)",
+        "fa": "فایل‌های اکسل (*.xlsx);;فایل‌های CSV (*.csv);;فایل‌های Parquet (*.parquet)",
+        "zh": "Excel 文件 (*.xlsx);;CSV 文件 (*.csv);;Parquet 文件 (*.parquet)",
+        "ru": "Файлы Excel (*.xlsx);;CSV-файлы (*.csv);;Файлы Parquet (*.parquet)",
+        "ja": "Excelファイル (*.xlsx);;CSVファイル (*.csv);;Parquetファイル (*.parquet)",
+        "ar": "ملفات Excel (*.xlsx);;ملفات CSV (*.csv);;ملفات Parquet (*.parquet)",
+        "ko": "Excel 파일 (*.xlsx);;CSV 파일 (*.csv);;Parquet 파일 (*.parquet)",
+        "de": "Excel-Dateien (*.xlsx);;CSV-Dateien (*.csv);;Parquet-Dateien (*.parquet)",
     },
 }
\ No newline at end of file